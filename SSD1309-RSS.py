@@ -82,6 +82,9 @@ UNKNOWN_FEED_TITLE = "Unknown Feed"
 # RSS取得/整形の設定
 RSS_ENTRY_LIMIT = 10
 
+# 説明文からHTMLタグを除去する正規表現（起動時に一度だけコンパイル）
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
 # RSSフィード（rss-read.meが未配置/空のときに使われるデフォルト）
 DEFAULT_RSS_FEEDS = [
     {"title": "NHKニュース"     , "url": "https://news.web.nhk/n-data/conf/na/rss/cat0.xml",       "color": 1, "type": "rss"},
@@ -137,6 +140,7 @@ class FeedItem(TypedDict):
     feed_color: int
     feed_index: int
     title_lines: List[str]
+    desc_line: str
     desc_width: Optional[int]
 
 # 周期/運用設定は AppConfig に集約
@@ -322,10 +326,12 @@ class RSSReaderApp:
         self._long_press_handled  = False         # 長押し処理済みフラグ
         self._display_enabled     = True          # True=表示点灯、False=消灯
         self._display_blank_drawn = False         # 消灯時にブランクを描画済みか
+        self._last_frame: Optional[bytes] = None  # 直近にOLEDへ送ったフレーム（同一内容なら転送を省略）
 
         # ロック（必要最小限）
         self._state_lock = threading.Lock()
         self._desc_width_cache: Dict[Tuple[int, str, int], int] = {}
+        self._header_clock: Tuple[str, int] = ("", 0)  # ヘッダ時刻文字列とその描画幅（分が変わるまで再計測しない）
 
     # 記事切替時の表示状態を初期化する
     def _reset_article_state(
@@ -339,10 +345,11 @@ class RSSReaderApp:
         self.scroll_position = 0.0
         self.transition_effect = self.config.transition_frames
         self.transition_direction = transition_direction
-        self.article_start_time = time.monotonic()
+        monotonic_now = time.monotonic()
+        self.article_start_time = monotonic_now
         self.auto_scroll_paused = True
         self._scroll_ease_elapsed = 0.0
-        self._last_scroll_time = time.monotonic()
+        self._last_scroll_time = monotonic_now
         if keep_feed_idx is not None and keep_item_idx is not None and keep_link is not None:
             keys_to_delete = [
                 key
@@ -465,7 +472,9 @@ class RSSReaderApp:
         settings = self.network_settings
         total_attempts = settings.max_retries + 1
         self.log.info(
-            f"Fetching RSS feeds... (timeout={settings.timeout}s, attempts={total_attempts})"
+            "Fetching RSS feeds... (timeout=%ss, attempts=%d)",
+            settings.timeout,
+            total_attempts,
         )
         self.loading_effect = self.layout_settings.loading_effect_ticks
 
@@ -478,7 +487,10 @@ class RSSReaderApp:
                 raise
             except Exception as exc:
                 self.log.error(
-                    f"RSS fetch error: {exc} (attempt {attempt}/{total_attempts})"
+                    "RSS fetch error: %s (attempt %d/%d)",
+                    exc,
+                    attempt,
+                    total_attempts,
                 )
                 successes, errors = {}, {}
 
@@ -492,12 +504,14 @@ class RSSReaderApp:
                 self._handle_partial_failures(errors)
 
             self.log.warning(
-                f"No feed items retrieved (attempt {attempt}/{total_attempts})"
+                "No feed items retrieved (attempt %d/%d)",
+                attempt,
+                total_attempts,
             )
 
             if attempt < total_attempts:
                 delay = settings.base_delay * (2 ** (attempt - 1))
-                self.log.debug(f"Retrying RSS fetch after {delay:.1f}s delay")
+                self.log.debug("Retrying RSS fetch after %.1fs delay", delay)
                 await asyncio.sleep(delay)
 
         if self._restore_failover_snapshot():
@@ -572,7 +586,7 @@ class RSSReaderApp:
             )
             for entry in entries
         ]
-        self.log.info(f" -> {feed_info['title']}: {len(feed_items)} items")
+        self.log.info(" -> %s: %d items", feed_info["title"], len(feed_items))
         return idx, feed_items, None
 
     # テキスト形式のフィードを取得して整形する
@@ -597,7 +611,7 @@ class RSSReaderApp:
             title=feed_info["title"],
             description=description,
         )
-        self.log.info(f" -> {feed_info['title']}: 1 item (text)")
+        self.log.info(" -> %s: 1 item (text)", feed_info["title"])
         return idx, [item], None
 
     # ローカルテキストファイルを読み込む
@@ -627,12 +641,13 @@ class RSSReaderApp:
             "feed_color": feed_info["color"],
             "feed_index": idx,
             "title_lines": title_lines,
+            "desc_line": description.replace("\n", " ").strip(),
             "desc_width": None,
         }
 
     @staticmethod
     def _sanitize_description(description: str) -> str:
-        return re.sub(r"<[^>]+>", "", description)
+        return HTML_TAG_PATTERN.sub("", description)
 
  
     # 取得結果をキャッシュへ反映する
@@ -648,7 +663,7 @@ class RSSReaderApp:
         snapshot = self._apply_cache_to_news()
         if snapshot is not None:
             total_items = sum(len(items) for items in snapshot.values())
-            self.log.info(f"Total items: {total_items}")
+            self.log.info("Total items: %d", total_items)
 
     # キャッシュ内容を表示用データへ適用する
     def _apply_cache_to_news(self) -> Optional[Dict[int, List[FeedItem]]]:
@@ -687,10 +702,12 @@ class RSSReaderApp:
             cache = self.feed_cache.get(idx)
             if cache and len(cache) > 0:
                 self.log.warning(
-                    f"Feed fallback used for {feed_name}: {error}"
+                    "Feed fallback used for %s: %s",
+                    feed_name,
+                    error,
                 )
             else:
-                self.log.error(f"Feed unavailable {feed_name}: {error}")
+                self.log.error("Feed unavailable %s: %s", feed_name, error)
 
 # 3) 描画・表示制御
     # 画面描画ユーティリティ
@@ -751,7 +768,7 @@ class RSSReaderApp:
             (base_x, y_pos, base_x + width - 4, y_pos + desc_background_height),
             fill=0,
         )
-        desc = item["description"].replace("\n", " ").strip()
+        desc = item["desc_line"]
         scroll_offset = int(self.scroll_position)
         desc_x = base_x if self.auto_scroll_paused else (base_x - scroll_offset)
         draw.text((desc_x, y_pos), desc, font=self.FONT, fill=1)
@@ -785,7 +802,9 @@ class RSSReaderApp:
             current_feed = self.rss_feeds[feed_idx]["title"]
         draw.text((2, 1), current_feed, font=self.TITLE_FONT, fill=0)
         current_time = time.strftime("%H:%M")
-        time_width = self.get_text_width(current_time, self.TITLE_FONT)
+        if current_time != self._header_clock[0]:
+            self._header_clock = (current_time, self.get_text_width(current_time, self.TITLE_FONT))
+        time_width = self._header_clock[1]
         draw.text((width - time_width - 3, 1), current_time, font=self.TITLE_FONT, fill=0)
         draw.line([(0, header_height), (width, header_height)], fill=1)
         content_y = header_height + layout.header_content_padding_y
@@ -916,76 +935,60 @@ class RSSReaderApp:
         with self._state_lock:
             prev_feed = self.current_feed_index
             prev_item = self.current_item_index
-            self.current_feed_index = (self.current_feed_index + 1) % len(self.rss_feeds)
+            feed_idx = (prev_feed + 1) % len(self.rss_feeds)
+            self.current_feed_index = feed_idx
             self.current_item_index = 0
             self._prev_feed_index = prev_feed
             self._prev_item_index = prev_item
             self.feed_switch_time = time.monotonic()
-            keep_link = ""
-            if (
-                self.news_items
-                and self.current_feed_index in self.news_items
-                and self.news_items[self.current_feed_index]
-            ):
-                keep_link = self.news_items[self.current_feed_index][
-                    self.current_item_index
-                ].get("link", "")
+            items = self.news_items.get(feed_idx)
+            keep_link = items[0].get("link", "") if items else ""
             self._reset_article_state(
                 transition_direction=-1,
-                keep_feed_idx=self.current_feed_index,
-                keep_item_idx=self.current_item_index,
+                keep_feed_idx=feed_idx,
+                keep_item_idx=0,
                 keep_link=keep_link,
             )
-        self.log.info(f"Feed switched -> {self.rss_feeds[self.current_feed_index]['title']}")
+        self.log.info("Feed switched -> %s", self.rss_feeds[feed_idx]["title"])
 
     # 次の記事へ
     # 次の記事へ進める
     def move_to_next_article(self):
         with self._state_lock:
-            if not self.news_items or self.current_feed_index not in self.news_items or not self.news_items[self.current_feed_index]:
+            feed_idx = self.current_feed_index
+            items = self.news_items.get(feed_idx)
+            if not items:
                 return
-            prev_feed = self.current_feed_index
             prev_item = self.current_item_index
-            if self.current_item_index < len(self.news_items[self.current_feed_index]) - 1:
-                self.current_item_index += 1
-            else:
-                self.current_item_index = 0
-            self._prev_feed_index = prev_feed
+            item_idx = prev_item + 1 if prev_item < len(items) - 1 else 0
+            self.current_item_index = item_idx
+            self._prev_feed_index = feed_idx
             self._prev_item_index = prev_item
-            keep_link = self.news_items[self.current_feed_index][self.current_item_index].get(
-                "link",
-                "",
-            )
             self._reset_article_state(
                 transition_direction=-1,
-                keep_feed_idx=self.current_feed_index,
-                keep_item_idx=self.current_item_index,
-                keep_link=keep_link,
+                keep_feed_idx=feed_idx,
+                keep_item_idx=item_idx,
+                keep_link=items[item_idx].get("link", ""),
             )
 
     # 前の記事へ（関数の呼び出しが掛かってないので、必要に応じてGPIOボタンなどに割り当てるなどをしてください）
     # 前の記事へ戻す
     def move_to_prev_article(self):
         with self._state_lock:
-            if not self.news_items or self.current_feed_index not in self.news_items or not self.news_items[self.current_feed_index]:
+            feed_idx = self.current_feed_index
+            items = self.news_items.get(feed_idx)
+            if not items:
                 return
-            prev_feed = self.current_feed_index
             prev_item = self.current_item_index
-            if self.current_item_index > 0:
-                self.current_item_index -= 1
-            else:
-                self.current_item_index = len(self.news_items[self.current_feed_index]) - 1
-            self._prev_feed_index = prev_feed
+            item_idx = prev_item - 1 if prev_item > 0 else len(items) - 1
+            self.current_item_index = item_idx
+            self._prev_feed_index = feed_idx
             self._prev_item_index = prev_item
-            keep_link = self.news_items[self.current_feed_index][self.current_item_index].get(
-                "link",
-                "",
-            )
             self._reset_article_state(
                 transition_direction=1,
-                keep_feed_idx=self.current_feed_index,
-                keep_item_idx=self.current_item_index,
-                keep_link=keep_link,
+                keep_feed_idx=feed_idx,
+                keep_item_idx=item_idx,
+                keep_link=items[item_idx].get("link", ""),
             )
 
 
@@ -1000,13 +1003,12 @@ class RSSReaderApp:
 
         # 記事と経過時間の取得（ロック下）
         with self._state_lock:
-            if (not self.news_items) or (self.current_feed_index not in self.news_items):
-                return
-            if not self.news_items[self.current_feed_index]:
-                return
             feed_idx = self.current_feed_index
+            items = self.news_items.get(feed_idx)
+            if not items:
+                return
             item_idx = self.current_item_index
-            item = self.news_items[feed_idx][item_idx]
+            item = items[item_idx]
             current_time = time.monotonic()
             elapsed_time = current_time - self.article_start_time
 
@@ -1019,7 +1021,7 @@ class RSSReaderApp:
                 return
 
             # 説明文の幅を計測
-            desc = item["description"].replace("\n", " ").strip()
+            desc = item["desc_line"]
             cache_key = (feed_idx, item.get("link", ""), item_idx)
             desc_width = self._desc_width_cache.get(cache_key)
             if desc_width is None:
@@ -1035,13 +1037,12 @@ class RSSReaderApp:
                 self.move_to_next_article()
             return
 
-        now = time.monotonic()
         delta_time = (
-            now - self._last_scroll_time
+            current_time - self._last_scroll_time
             if self._last_scroll_time
             else self.config.main_update_interval
         )
-        self._last_scroll_time = now
+        self._last_scroll_time = current_time
         self._scroll_ease_elapsed = min(
             self._scroll_ease_elapsed + delta_time,
             self.animation_settings.easing_duration,
@@ -1081,35 +1082,43 @@ class RSSReaderApp:
             self.log.debug("GPIO module not available, polling loop not started")
             return
 
+        # 20ms周期で回るため、設定値と関数参照はループ外で束縛しておく
+        read_button = GPIO.input
+        monotonic = time.monotonic
+        poll_interval = self.config.gpio_poll_interval
+        debounce_sec = self.config.debounce_sec
+        long_press_interval = self.config.long_press_interval
+        double_click_interval = self.config.double_click_interval
+
         self.log.info("GPIO polling task started")
         while not self._stop_event.is_set():
             try:
-                state = GPIO.input(BUTTON_FEED)
-                now = time.monotonic()
+                state = read_button(BUTTON_FEED)
+                now = monotonic()
                 if self._prev_button_state == 1 and state == 0:
-                    if now - self._last_edge_time < self.config.debounce_sec:
+                    if now - self._last_edge_time < debounce_sec:
                         self._prev_button_state = state
-                        await asyncio.sleep(self.config.gpio_poll_interval)
+                        await asyncio.sleep(poll_interval)
                         continue
                     self._last_edge_time = now
                     self._press_start_time = now
                     self._long_press_handled = False
 
                 if state == 0 and not self._long_press_handled:
-                    if now - self._press_start_time >= self.config.long_press_interval:
+                    if now - self._press_start_time >= long_press_interval:
                         self._set_display_enabled(not self._display_enabled)
                         self._long_press_handled = True
                         self._click_count = 0
                         self._last_press_time = 0.0
 
                 if self._prev_button_state == 0 and state == 1:
-                    if now - self._last_edge_time < self.config.debounce_sec:
+                    if now - self._last_edge_time < debounce_sec:
                         self._prev_button_state = state
-                        await asyncio.sleep(self.config.gpio_poll_interval)
+                        await asyncio.sleep(poll_interval)
                         continue
                     self._last_edge_time = now
                     if not self._long_press_handled:
-                        if now - self._last_press_time <= self.config.double_click_interval:
+                        if now - self._last_press_time <= double_click_interval:
                             self._click_count += 1
                         else:
                             self._click_count = 1
@@ -1117,7 +1126,7 @@ class RSSReaderApp:
                     else:
                         self._click_count = 0
 
-                if self._click_count > 0 and (now - self._last_press_time) > self.config.double_click_interval:
+                if self._click_count > 0 and (now - self._last_press_time) > double_click_interval:
                     if self._click_count == 1:
                         self.move_to_next_article()
                         self.log.info("[GPIO] Single click -> next article")
@@ -1127,11 +1136,11 @@ class RSSReaderApp:
                     self._click_count = 0
 
                 self._prev_button_state = state
-                await asyncio.sleep(self.config.gpio_poll_interval)
+                await asyncio.sleep(poll_interval)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
-                self.log.error(f"GPIO polling error: {e}")
+                self.log.error("GPIO polling error: %s", e)
                 await asyncio.sleep(0.1)
 
     # 時間帯表示制御
@@ -1182,6 +1191,7 @@ class RSSReaderApp:
         try:
             self.display.display(blank)
             self._display_blank_drawn = True
+            self._last_frame = None
         except Exception:
             pass
 
@@ -1233,11 +1243,15 @@ class RSSReaderApp:
 
         self.update_scroll_position()
         image = self.draw_rss_screen()
-        try:
-            self.display.display(image)
-            self._display_blank_drawn = False
-        except Exception as e:
-            self.log.warning(f"OLED display error: {e}")
+        # 前回と同じ画面ならI2C/SPI転送を省略する（停止中・短文表示中など）
+        frame = image.tobytes()
+        if frame != self._last_frame:
+            try:
+                self.display.display(image)
+                self._display_blank_drawn = False
+                self._last_frame = frame
+            except Exception as e:
+                self.log.warning("OLED display error: %s", e)
         self._last_main_update = now
 
     # 自動フィード切替を管理する
@@ -1248,7 +1262,7 @@ class RSSReaderApp:
         try:
             self.switch_feed()
         except Exception as e:
-            self.log.warning(f"Auto feed switch error: {e}")
+            self.log.warning("Auto feed switch error: %s", e)
         finally:
             self._last_feed_switch_check = now
 